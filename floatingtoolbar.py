@@ -2,12 +2,362 @@
 
 import sys
 import subprocess
-import configparser
+import shlex
+import shutil
+import functools
+import re
 import os
+import signal
+import pickle
+import struct
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from PyQt6.QtWidgets import (QApplication, QWidget, QHBoxLayout, QVBoxLayout,
-                           QPushButton, QSizePolicy, QComboBox, QLabel, QMessageBox)
-from PyQt6.QtCore import Qt, QSettings, QSize, QPropertyAnimation, QRect, QEasingCurve
-from PyQt6.QtGui import QIcon
+                           QPushButton, QComboBox, QLabel, QMessageBox,
+                           QListView)
+from PyQt6.QtCore import (Qt, QSize, QTimer, QSignalBlocker, QPropertyAnimation,
+                          QEasingCurve, QEvent, QStringListModel)
+from PyQt6.QtGui import (QIcon, QPixmap, QPainter, QFont, QColor,
+                         QPixmapCache, QShortcut, QKeySequence)
+
+# Precompiled patterns for the INI parser below
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+# Shell metacharacters that force a command through /bin/sh. Tilde is not
+# included: shlex + expanduser cover home-relative paths without a shell.
+_SHELL_META_RE = re.compile(r'[;|&<>$`*?(){}\n\\]')
+
+# Shared button styles, set once on the toolbar window so Qt compiles
+# them a single time and matches by object name: ToolbarBtn for the
+# transport buttons, CtrlBtn for the OK/Cancel/Quit panel buttons
+_BUTTON_QSS = """
+    QPushButton#ToolbarBtn {
+        border: 1px solid #666;
+        border-radius: 4px;
+        background-color: #333;
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#ToolbarBtn:hover {
+        background-color: #555;
+        border: 1px solid #888;
+    }
+    QPushButton#ToolbarBtn:pressed {
+        background-color: #222;
+        border: 1px solid #999;
+    }
+    QPushButton#CtrlBtn {
+        border: 1px solid #666;
+        border-radius: 4px;
+        background-color: #333;
+        color: white;
+        font-size: 12pt;
+        font-weight: bold;
+        text-align: center;
+        padding: 0px;
+    }
+    QPushButton#CtrlBtn:hover {
+        background-color: #555;
+        border: 1px solid #888;
+    }
+    QPushButton#CtrlBtn:pressed {
+        background-color: #222;
+        border: 1px solid #999;
+    }
+"""
+
+# Stylesheets for the initializing banner and the expanded options panel,
+# kept at module level so the same interned strings are reused across
+# panel rebuilds instead of reassembled per call
+_INIT_LABEL_QSS = """
+    QLabel {
+        background-color: #2b2b2b;
+        color: white;
+        padding: 2px;
+        font-size: 10px;
+    }
+"""
+
+_PANEL_QSS = """
+    QWidget#OptionsPanel {
+        background-color: #2b2b2b;
+        border: 1px solid #666;
+        border-top: none;
+    }
+    QLabel {
+        color: white;
+        font-weight: bold;
+        padding: 5px;
+    }
+    QComboBox {
+        background-color: #404040;
+        color: white;
+        border: 1px solid #666;
+        padding: 5px;
+        min-width: 120px;
+        combobox-popup: 0;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        border: 2px solid #666;
+        border-radius: 2px;
+    }
+"""
+
+# Default config payload, written verbatim on first launch
+_DEFAULT_INI = b"""[Commands]
+record = echo "Record pressed"
+rewind = echo "Rewind pressed"
+play = echo "Play pressed"
+pause = echo "Pause pressed"
+resume = echo "Resume pressed"
+stop = echo "Stop pressed"
+fast_forward = echo "Fast forward pressed"
+
+[VoiceSpeed]
+voicechoices = af_bella,af_nicole,af_heart,af_alloy,af_aoede,af_jessica,af_kore,af_nova,af_river,af_sarah,af_sky,am_adam,am_echo,am_eric,am_fenrir,am_liam,am_michael,am_onyx,am_puck,am_santa
+voicechange = echo "Voice changed to {choice}"
+speedchoices = 1.0,1.1,1.2,1.4,2.0,0.75
+speedchange = echo "Speed changed to {choice}"
+
+[Appearance]
+button_size = 40
+window_opacity = 0.9
+stay_on_top = true
+initial_x = 100
+initial_y = 100
+animation = 1
+
+[CurrentSettings]
+current_voice =
+current_speed =
+"""
+
+# Transport state machine: (button, play_state) -> (command to run, new
+# state or None to keep, log message). A None state in the key is the
+# wildcard row for that button.
+_DISPATCH = {
+    ('play', 'paused'): ('resume', 'playing', 'Resumed playback'),
+    ('play', None): ('play', 'playing', 'Started/restarted playback'),
+    ('pause', 'playing'): ('pause', 'paused', 'Paused playback'),
+    ('pause', 'paused'): ('resume', 'playing', 'Resumed from pause button'),
+    ('pause', None): ('pause', None, 'Executed pause command, keeping state'),
+    ('stop', None): ('stop', '', 'Stopped playback'),
+    ('rewind', None): ('rewind', 'playing', 'Seeking (rewind)'),
+    ('fast_forward', None): ('fast_forward', 'playing', 'Seeking (fast_forward)'),
+    ('record', None): ('record', None, 'Executed record command')
+}
+
+@dataclass(frozen=True, slots=True)
+class ToolbarConfig:
+    """Immutable snapshot of the INI-derived settings.
+
+    Frozen + slots keeps the per-instance footprint to fixed offsets and
+    guarantees hot paths can't accidentally mutate configuration.
+    """
+    button_size: int = 40
+    opacity: float = 0.9
+    initial_x: int = 100
+    initial_y: int = 100
+    animate: bool = True
+    init_delay_ms: int = 2000
+    remember_settings: bool = True
+    confirm_quit: bool = True
+    voice_change_tpl: str = ''
+    speed_change_tpl: str = ''
+    voice_choices: tuple = ()
+    speed_choices: tuple = ()
+    voice_set: frozenset = frozenset()
+    speed_set: frozenset = frozenset()
+    voice_change_argv: tuple = None
+    speed_change_argv: tuple = None
+    commands: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    argv: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    speed_defaults: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+# Standard transport buttons; 'record' is prepended when configured
+_BUTTONS_CONFIG = (
+    ('rewind', '⏮', 'Rewind'),
+    ('play', '▶', 'Play'),
+    ('pause', '⏸', 'Pause'),
+    ('stop', '⏹', 'Stop'),
+    ('fast_forward', '⏭', 'Fast Forward')
+)
+
+def _template_argv(command):
+    """Pre-split a {choice} command template into argv for direct exec.
+
+    Returns None when the template is empty, needs a shell, or cannot be
+    tokenized, in which case callers fall back to the shell path.
+    """
+    # Check metacharacters with the placeholder masked out: '{choice}'
+    # itself would trip the brace check, but the braces never survive
+    # substitution and choice values are inserted as whole argv tokens
+    if not command or _SHELL_META_RE.search(command.replace('{choice}', '')):
+        return None
+    try:
+        argv = [os.path.expanduser(arg) for arg in shlex.split(command)]
+    except ValueError:
+        return None
+    if not argv:
+        return None
+    argv[0] = shutil.which(argv[0]) or argv[0]
+    return tuple(argv)
+
+def _to_int(value, default):
+    """Parse an INI int, falling back to the default on malformed input"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+def _to_float(value, default):
+    """Parse an INI float, falling back to the default on malformed input"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+# Media-control glyphs pre-rendered to pixmaps, keyed by (symbol, size).
+# Buttons blit these on repaint instead of shaping/rasterizing the glyph
+# through the text pipeline every time
+# Qt exposes no portable prefers-reduced-motion hint, so honor the common
+# opt-out via environment: any non-empty value other than '0' disables the
+# expand/collapse animation regardless of the config file
+_REDUCE_MOTION = os.environ.get('TOOLBAR_REDUCE_MOTION', '') not in ('', '0')
+
+_ICON_CACHE = {}
+
+def _symbol_icon(symbol, size):
+    """Render a media-control glyph once and reuse it as a QIcon.
+
+    The QIcon wrappers live in _ICON_CACHE; the rasterized pixmap also
+    goes through QPixmapCache so Qt shares the backing store with any
+    other user of the same key and can evict it under memory pressure.
+    """
+    key = (symbol, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        cache_key = f'toolbar-glyph:{symbol}:{size}'
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None:
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            font = QFont()
+            font.setPixelSize(16)
+            font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(QColor('white'))
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, symbol)
+            painter.end()
+            QPixmapCache.insert(cache_key, pixmap)
+        icon = QIcon(pixmap)
+        _ICON_CACHE[key] = icon
+    return icon
+
+class FastIni:
+    """Tiny INI parser covering just what the toolbar config needs.
+
+    The full configparser module is overkill for a flat key = value file
+    with no interpolation or continuations, and is noticeably slower to
+    import and read. Keys are lowercased like configparser does; section
+    names keep their case.
+    """
+
+    BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                      '0': False, 'no': False, 'false': False, 'off': False}
+
+    def __init__(self):
+        self._sections = {}
+
+    @staticmethod
+    def parse(path):
+        """Parse an INI file into a nested dict of sections"""
+        sections = {}
+        current = None
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith(('#', ';')):
+                    continue
+                match = _SECTION_RE.match(line)
+                if match:
+                    current = sections.setdefault(match.group(1), {})
+                    continue
+                match = _KV_RE.match(line)
+                if match and current is not None:
+                    current[match.group(1).lower()] = match.group(2)
+        return sections
+
+    def read(self, path):
+        self._sections = self.parse(path)
+
+    def read_cached(self, path):
+        """Read an INI file, reusing an on-disk snapshot when it is fresh.
+
+        The parsed dict is persisted next to the INI as '<path>.cache'
+        (mtime_ns header + pickled sections), so launches after the first
+        skip the file read and regex work entirely. Any problem with the
+        cache just falls back to a normal parse.
+        """
+        cache_path = path + '.cache'
+        mtime_ns = os.stat(path).st_mtime_ns
+        try:
+            with open(cache_path, 'rb') as f:
+                header = f.read(8)
+                if struct.unpack('<Q', header)[0] == mtime_ns:
+                    self._sections = pickle.loads(f.read())
+                    return
+        except (OSError, pickle.PickleError, struct.error, EOFError):
+            pass
+        self._sections = self.parse(path)
+        try:
+            with open(cache_path, 'wb') as f:
+                f.write(struct.pack('<Q', mtime_ns))
+                f.write(pickle.dumps(self._sections, protocol=5))
+        except OSError:
+            pass  # Cache is best-effort; the parse already succeeded
+
+    def get(self, section, option, fallback=None):
+        return self._sections.get(section, {}).get(option.lower(), fallback)
+
+    def getboolean(self, section, option, fallback=None):
+        value = self.get(section, option)
+        if value is None:
+            return fallback
+        return self.BOOLEAN_STATES.get(value.strip().lower(), fallback)
+
+    def has_section(self, section):
+        return section in self._sections
+
+    def has_option(self, section, option):
+        return option.lower() in self._sections.get(section, {})
+
+    def add_section(self, section):
+        self._sections.setdefault(section, {})
+
+    def remove_section(self, section):
+        return self._sections.pop(section, None) is not None
+
+    def section(self, name):
+        """Return a section's options as a plain dict (copy)"""
+        return dict(self._sections.get(name, {}))
+
+    def set(self, section, option, value):
+        self._sections[section][option.lower()] = value
+
+    def write(self, f):
+        for i, (section, values) in enumerate(self._sections.items()):
+            if i:
+                f.write('\n')
+            f.write('[%s]\n' % section)
+            for key, value in values.items():
+                f.write('%s = %s\n' % (key, value))
 
 class FloatingToolbar(QWidget):
     def __init__(self):
@@ -15,7 +365,11 @@ class FloatingToolbar(QWidget):
         self.config_file = "toolbar_config.ini"
         self.expanded = False
         self.expanded_widget = None
-        self.animation = None
+        self.voice_combo = None
+        self.speed_combo = None
+        self._quit_box = None
+        self.animation = None  # One persistent expand/collapse animation
+        self._anim_collapsing = False
         self.current_voice = None
         self.current_speed = None
         self.pending_voice = None  # Voice selected in dropdown but not applied yet
@@ -23,57 +377,113 @@ class FloatingToolbar(QWidget):
         self.initializing = False
         self.init_label = None
         self.play_state = ""  # "", "playing", or "paused"
+        self._sh = None  # Long-lived /bin/sh coprocess for shell commands
+        self._settings_dirty = False  # current_voice/speed changed since last save
+        # posix_spawn'd children are never waited on individually; reap
+        # them as they exit so they don't accumulate as zombies
+        signal.signal(signal.SIGCHLD, self._reap_children)
         self.load_config()
         self.init_ui()
+        # Warm the shell coprocess now if any configured command will
+        # need it, so the first click pays only a pipe write
+        if any(key not in self.cfg.argv for key in self.cfg.commands):
+            try:
+                self._ensure_shell()
+            except OSError:
+                pass  # Fall back to lazy start on first use
         self.initialize_settings()
         
     def load_config(self):
         """Load configuration from INI file"""
-        self.config = configparser.ConfigParser()
-        
-        # Create default config if it doesn't exist
-        if not os.path.exists(self.config_file):
-            self.create_default_config()
-        
-        self.config.read(self.config_file)
+        self.config = FastIni()
+
+        # EAFP: read directly and only create the default config if the
+        # file turns out to be missing (saves a stat on the common path).
+        # Any other OSError (permissions, path is a directory) is treated
+        # like configparser.read's silent skip: run with fallback values.
+        try:
+            self.config.read_cached(self.config_file)
+        except FileNotFoundError:
+            try:
+                self.create_default_config()
+                self.config.read_cached(self.config_file)
+            except OSError as e:
+                print(f"Could not create config file: {e}")
+        except OSError as e:
+            print(f"Could not read config file: {e}")
         
         # Load current settings
         self.current_voice = self.config.get('CurrentSettings', 'current_voice', fallback='')
         self.current_speed = self.config.get('CurrentSettings', 'current_speed', fallback='')
+
+        # Choice lists are constant for the process lifetime; split them
+        # once here instead of on every panel open. The sets make the
+        # current-selection membership checks O(1).
+        voice_change_tpl = self.config.get('VoiceSpeed', 'VoiceChange', fallback='')
+        speed_change_tpl = self.config.get('VoiceSpeed', 'SpeedChange', fallback='')
+        voice_choices = tuple(c.strip() for c in
+                              self.config.get('VoiceSpeed', 'VoiceChoices', fallback='').split(',')
+                              if c.strip())
+        speed_choices = tuple(c.strip() for c in
+                              self.config.get('VoiceSpeed', 'SpeedChoices', fallback='').split(',')
+                              if c.strip())
+
+        commands = {}
+        if self.config.has_section('Commands'):
+            for key in ('record', 'rewind', 'play', 'pause', 'resume', 'stop', 'fast_forward'):
+                if self.config.has_option('Commands', key):
+                    commands[key] = self.config.get('Commands', key)
+
+        # Pre-resolve each command's executable once (expanduser + PATH
+        # walk) so per-click spawns don't stat their way down PATH, and
+        # pre-parse commands without shell metacharacters into argv tuples
+        # so button presses can posix_spawn them directly (no /bin/sh)
+        cmd_argv = {}
+        for key, command in list(commands.items()):
+            parts = command.split(None, 1)
+            if not parts:
+                continue
+            argv0 = os.path.expanduser(parts[0])
+            resolved = shutil.which(argv0) or argv0
+            if resolved != parts[0]:
+                command = resolved if len(parts) == 1 else resolved + ' ' + parts[1]
+                commands[key] = command
+            if not _SHELL_META_RE.search(command):
+                try:
+                    argv = shlex.split(command)
+                except ValueError:
+                    continue  # Unbalanced quotes etc. - leave it to the shell
+                if argv:
+                    cmd_argv[key] = tuple(os.path.expanduser(arg) for arg in argv)
+
+        # One immutable snapshot of everything the UI and click handlers
+        # read; malformed numbers fall back to the documented defaults
+        self.cfg = ToolbarConfig(
+            button_size=_to_int(self.config.get('Appearance', 'button_size'), 40),
+            opacity=_to_float(self.config.get('Appearance', 'window_opacity'), 0.9),
+            initial_x=_to_int(self.config.get('Appearance', 'initial_x'), 100),
+            initial_y=_to_int(self.config.get('Appearance', 'initial_y'), 100),
+            animate=self.config.getboolean('Appearance', 'animation', fallback=True),
+            init_delay_ms=_to_int(self.config.get('Behavior', 'InitializationDelay'), 2000),
+            remember_settings=self.config.getboolean('Behavior', 'Remember_Voice_and_Speed', fallback=True),
+            confirm_quit=self.config.getboolean('Behavior', 'ConfirmQuit', fallback=True),
+            voice_change_tpl=voice_change_tpl,
+            speed_change_tpl=speed_change_tpl,
+            voice_choices=voice_choices,
+            speed_choices=speed_choices,
+            voice_set=frozenset(voice_choices),
+            speed_set=frozenset(speed_choices),
+            voice_change_argv=_template_argv(voice_change_tpl),
+            speed_change_argv=_template_argv(speed_change_tpl),
+            commands=MappingProxyType(commands),
+            argv=MappingProxyType(cmd_argv),
+            speed_defaults=MappingProxyType(self.config.section('SpeedDefaults'))
+        )
         
     def create_default_config(self):
         """Create default configuration file"""
-        config = configparser.ConfigParser()
-        config['Commands'] = {
-            'record': 'echo "Record pressed"',
-            'rewind': 'echo "Rewind pressed"',
-            'play': 'echo "Play pressed"',
-            'pause': 'echo "Pause pressed"',
-            'resume': 'echo "Resume pressed"',
-            'stop': 'echo "Stop pressed"',
-            'fast_forward': 'echo "Fast forward pressed"'
-        }
-        config['VoiceSpeed'] = {
-            'VoiceChoices': 'af_bella,af_nicole,af_heart,af_alloy,af_aoede,af_jessica,af_kore,af_nova,af_river,af_sarah,af_sky,am_adam,am_echo,am_eric,am_fenrir,am_liam,am_michael,am_onyx,am_puck,am_santa',
-            'VoiceChange': 'echo "Voice changed to {choice}"',
-            'SpeedChoices': '1.0,1.1,1.2,1.4,2.0,0.75',
-            'SpeedChange': 'echo "Speed changed to {choice}"'
-        }
-        config['Appearance'] = {
-            'button_size': '40',
-            'window_opacity': '0.9',
-            'stay_on_top': 'true',
-            'initial_x': '100',
-            'initial_y': '100',
-            'animation': '1'
-        }
-        config['CurrentSettings'] = {
-            'current_voice': '',
-            'current_speed': ''
-        }
-        
-        with open(self.config_file, 'w') as f:
-            config.write(f)
+        with open(self.config_file, 'wb') as f:
+            f.write(_DEFAULT_INI)
             
     def init_ui(self):
         """Initialize the user interface"""
@@ -86,8 +496,7 @@ class FloatingToolbar(QWidget):
         self.setWindowTitle("Music Control Toolbar")
         
         # Set opacity if configured
-        opacity = float(self.config.get('Appearance', 'window_opacity', fallback='0.9'))
-        self.setWindowOpacity(opacity)
+        self.setWindowOpacity(self.cfg.opacity)
         
         # Create main layout
         self.main_layout = QVBoxLayout()
@@ -97,14 +506,7 @@ class FloatingToolbar(QWidget):
         # Create initialization label (hidden by default)
         self.init_label = QLabel("Initializing...")
         self.init_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.init_label.setStyleSheet("""
-            QLabel {
-                background-color: #2b2b2b;
-                color: white;
-                padding: 2px;
-                font-size: 10px;
-            }
-        """)
+        self.init_label.setStyleSheet(_INIT_LABEL_QSS)
         self.init_label.hide()
         self.main_layout.addWidget(self.init_label)
         
@@ -113,52 +515,33 @@ class FloatingToolbar(QWidget):
         toolbar_layout.setContentsMargins(0, 0, 0, 0)
         toolbar_layout.setSpacing(1)
         
-        # Button configuration - check if record command exists
-        button_size = int(self.config.get('Appearance', 'button_size', fallback='40'))
-        buttons_config = []
-        
-        # Add record button if configured
-        if self.config.has_option('Commands', 'record'):
-            buttons_config.append(('record', '⏺', 'Record'))
-            
-        # Add standard buttons
-        buttons_config.extend([
-            ('rewind', '⏮', 'Rewind'),
-            ('play', '▶', 'Play'), 
-            ('pause', '⏸', 'Pause'),
-            ('stop', '⏹', 'Stop'),
-            ('fast_forward', '⏭', 'Fast Forward')
-        ])
-        
-        # Create buttons
+        # Button configuration - prepend record if a command is configured
+        button_size = self.cfg.button_size
+        if 'record' in self.cfg.commands:
+            buttons_config = (('record', '⏺', 'Record'),) + _BUTTONS_CONFIG
+        else:
+            buttons_config = _BUTTONS_CONFIG
+
+        # Create buttons with updates and layout activation suspended so
+        # the loop doesn't trigger a relayout per addWidget
+        self.setUpdatesEnabled(False)
+        toolbar_layout.setEnabled(False)
+        btn_qsize = QSize(button_size, button_size)
+        icon_size = button_size - 8
+        icon_qsize = QSize(icon_size, icon_size)
         for cmd_key, symbol, tooltip in buttons_config:
-            button = QPushButton(symbol)
-            button.setFixedSize(QSize(button_size, button_size))
+            button = QPushButton()
+            button.setObjectName("ToolbarBtn")
+            button.setFixedSize(btn_qsize)
+            button.setIcon(_symbol_icon(symbol, icon_size))
+            button.setIconSize(icon_qsize)
             button.setToolTip(tooltip)
-            button.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #666;
-                    border-radius: 4px;
-                    background-color: #333;
-                    color: white;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #555;
-                    border: 1px solid #888;
-                }
-                QPushButton:pressed {
-                    background-color: #222;
-                    border: 1px solid #999;
-                }
-            """)
-            
-            # Connect button to command
-            button.clicked.connect(lambda checked, key=cmd_key: self.execute_command(key))
+
+            # Connect button to command (partial avoids a per-button lambda)
+            button.clicked.connect(functools.partial(self.execute_command, cmd_key))
             
             # Enable dragging on buttons
-            self.setup_dragging(button)
+            button.installEventFilter(self)
             
             toolbar_layout.addWidget(button)
             
@@ -168,92 +551,131 @@ class FloatingToolbar(QWidget):
         self.main_layout.addWidget(toolbar_widget)
         
         self.setLayout(self.main_layout)
-        
+
+        # One stylesheet compile for all toolbar buttons
+        self.setStyleSheet(_BUTTON_QSS)
+
+        # Re-enable layout and updates for a single geometry pass
+        toolbar_layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
+
         # Size window to fit content
         self.adjustSize()
         self.setFixedWidth(self.width())
         
         # Position window from config
-        initial_x = int(self.config.get('Appearance', 'initial_x', fallback='100'))
-        initial_y = int(self.config.get('Appearance', 'initial_y', fallback='100'))
-        self.move(initial_x, initial_y)
+        self.move(self.cfg.initial_x, self.cfg.initial_y)
         
         # Make window draggable
         self.draggable = False
         self.drag_started = False
-        self.offset = None
-        self.press_pos = None
+        self._off_x = 0  # Drag offset (global press point minus window origin)
+        self._off_y = 0
+        self._press_x = 0
+        self._press_y = 0
+
+        # Coalesce drag moves to ~60 Hz; high-refresh mice deliver move
+        # events much faster than the window manager needs repositions
+        self._pending_pos = None
+        self._pos_dirty = False  # Position changed by dragging, not yet saved
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_move)
         
         # Add keyboard shortcut for quit (Ctrl+Q)
-        from PyQt6.QtGui import QShortcut, QKeySequence
         quit_shortcut = QShortcut(QKeySequence("Ctrl+Q"), self)
         quit_shortcut.activated.connect(self.confirm_quit)
         
+    def _queue_move(self, x, y):
+        """Queue a window reposition, applied at most once per frame"""
+        self._pending_pos = (x, y)
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _apply_pending_move(self):
+        """Apply the most recent queued drag position"""
+        if self._pending_pos is not None:
+            self.move(self._pending_pos[0], self._pending_pos[1])
+            self._pending_pos = None
+            self._pos_dirty = True
+
+    def _refit(self):
+        """Re-fit the fixed window size to the content in one pass"""
+        self.setUpdatesEnabled(False)
+        self.adjustSize()
+        self.setFixedSize(self.size())
+        self.setUpdatesEnabled(True)
+
+    def _save_position(self):
+        """Flush the dragged position to initial_x/initial_y, once, on exit"""
+        if not self._pos_dirty:
+            return
+        self._pos_dirty = False
+        pos = self.pos()
+        if self.config.has_section('Appearance'):
+            self.config.set('Appearance', 'initial_x', str(pos.x()))
+            self.config.set('Appearance', 'initial_y', str(pos.y()))
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+            text = re.sub(r'(?m)^initial_x\s*=.*$', 'initial_x = %d' % pos.x(), text)
+            text = re.sub(r'(?m)^initial_y\s*=.*$', 'initial_y = %d' % pos.y(), text)
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except OSError as e:
+            print(f"Error saving window position: {e}")
+
+    def _virtualize_combo(self, combo):
+        """Give a combo a batched, uniform-size list view.
+
+        With the default popup every row is laid out when the popup
+        opens; a batched QListView keeps that proportional to the
+        visible rows instead, which matters if someone configures a
+        large voice catalog.
+        """
+        view = QListView(combo)
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(50)
+        combo.setView(view)
+        combo.setMaxVisibleItems(15)
+
     def create_expanded_widget(self):
         """Create the expanded options widget"""
         expanded_widget = QWidget()
-        expanded_widget.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                border: 1px solid #666;
-                border-top: none;
-            }
-            QLabel {
-                color: white;
-                font-weight: bold;
-                padding: 5px;
-            }
-            QComboBox {
-                background-color: #404040;
-                color: white;
-                border: 1px solid #666;
-                padding: 5px;
-                min-width: 120px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                border: 2px solid #666;
-                border-radius: 2px;
-            }
-            QPushButton {
-                background-color: #404040;
-                color: white;
-                border: 1px solid #666;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: 50px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-            }
-            QPushButton:pressed {
-                background-color: #222;
-            }
-        """)
+        # Scope the panel rule by object name: a nearer sheet's bare
+        # QWidget rule would override the window-level #CtrlBtn styles on
+        # the OK/Cancel/Quit buttons regardless of selector specificity
+        expanded_widget.setObjectName("OptionsPanel")
+        expanded_widget.setStyleSheet(_PANEL_QSS)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(5, 5, 5, 5)  # Add margins: left, top, right, bottom
         layout.setSpacing(8)
         
-        # Voice selection
-        if self.config.has_section('VoiceSpeed') and self.config.has_option('VoiceSpeed', 'VoiceChoices'):
+        # Voice selection; the choice list was split once at config load
+        if self.cfg.voice_choices:
             voice_layout = QHBoxLayout()
             voice_label = QLabel("Voice:")
             voice_label.setFixedWidth(60)
             self.voice_combo = QComboBox()
-            
-            voice_choices = self.config.get('VoiceSpeed', 'VoiceChoices', fallback='').split(',')
-            voice_choices = [choice.strip() for choice in voice_choices if choice.strip()]
-            self.voice_combo.addItems(voice_choices)
-            
+            self._virtualize_combo(self.voice_combo)
+
+            # Populate in one model reset with signals and updates off so
+            # the view lays out once instead of once per inserted item
+            model = QStringListModel(self.cfg.voice_choices, self.voice_combo)
+            self.voice_combo.blockSignals(True)
+            self.voice_combo.setUpdatesEnabled(False)
+            self.voice_combo.setModel(model)
+
             # Set current selection if available
-            if self.current_voice and self.current_voice in voice_choices:
+            if self.current_voice and self.current_voice in self.cfg.voice_set:
                 self.voice_combo.setCurrentText(self.current_voice)
                 self.pending_voice = self.current_voice
-            
+
+            self.voice_combo.setUpdatesEnabled(True)
+            self.voice_combo.blockSignals(False)
             self.voice_combo.currentTextChanged.connect(self.on_voice_dropdown_changed)
             
             voice_layout.addWidget(voice_label)
@@ -262,21 +684,26 @@ class FloatingToolbar(QWidget):
             layout.addLayout(voice_layout)
         
         # Speed selection
-        if self.config.has_section('VoiceSpeed') and self.config.has_option('VoiceSpeed', 'SpeedChoices'):
+        if self.cfg.speed_choices:
             speed_layout = QHBoxLayout()
             speed_label = QLabel("Speed:")
             speed_label.setFixedWidth(60)
             self.speed_combo = QComboBox()
-            
-            speed_choices = self.config.get('VoiceSpeed', 'SpeedChoices', fallback='').split(',')
-            speed_choices = [choice.strip() for choice in speed_choices if choice.strip()]
-            self.speed_combo.addItems(speed_choices)
-            
+            self._virtualize_combo(self.speed_combo)
+
+            # Same one-shot model reset as the voice combo
+            model = QStringListModel(self.cfg.speed_choices, self.speed_combo)
+            self.speed_combo.blockSignals(True)
+            self.speed_combo.setUpdatesEnabled(False)
+            self.speed_combo.setModel(model)
+
             # Set current selection if available
-            if self.current_speed and self.current_speed in speed_choices:
+            if self.current_speed and self.current_speed in self.cfg.speed_set:
                 self.speed_combo.setCurrentText(self.current_speed)
                 self.pending_speed = self.current_speed
-            
+
+            self.speed_combo.setUpdatesEnabled(True)
+            self.speed_combo.blockSignals(False)
             self.speed_combo.currentTextChanged.connect(self.on_speed_dropdown_changed)
             
             speed_layout.addWidget(speed_label)
@@ -290,83 +717,26 @@ class FloatingToolbar(QWidget):
         button_layout.setSpacing(1)  # Same spacing as top buttons
         
         # Calculate button width: 2x the toolbar button size
-        toolbar_button_size = int(self.config.get('Appearance', 'button_size', fallback='40'))
+        toolbar_button_size = self.cfg.button_size
         control_button_width = toolbar_button_size * 2
         
         # Create the three buttons
         ok_button = QPushButton("OK")
         ok_button.setFixedSize(QSize(control_button_width, toolbar_button_size))
         ok_button.setFlat(False)  # Ensure it's a normal button
-        ok_button.setStyleSheet("""
-            QPushButton {
-                border: 1px solid #666;
-                border-radius: 4px;
-                background-color: #333;
-                color: white;
-                font-size: 12pt;
-                font-weight: bold;
-                text-align: center;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-                border: 1px solid #888;
-            }
-            QPushButton:pressed {
-                background-color: #222;
-                border: 1px solid #999;
-            }
-        """)
+        ok_button.setObjectName("CtrlBtn")
         ok_button.clicked.connect(self.collapse_options)
         
         cancel_button = QPushButton("Cancel")
         cancel_button.setFixedSize(QSize(control_button_width, toolbar_button_size))
         cancel_button.setFlat(False)
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                border: 1px solid #666;
-                border-radius: 4px;
-                background-color: #333;
-                color: white;
-                font-size: 12pt;
-                font-weight: bold;
-                text-align: center;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-                border: 1px solid #888;
-            }
-            QPushButton:pressed {
-                background-color: #222;
-                border: 1px solid #999;
-            }
-        """)
+        cancel_button.setObjectName("CtrlBtn")
         cancel_button.clicked.connect(self.cancel_changes)
         
         quit_button = QPushButton("Quit")
         quit_button.setFixedSize(QSize(control_button_width, toolbar_button_size))
         quit_button.setFlat(False)
-        quit_button.setStyleSheet("""
-            QPushButton {
-                border: 1px solid #666;
-                border-radius: 4px;
-                background-color: #333;
-                color: white;
-                font-size: 12pt;
-                font-weight: bold;
-                text-align: center;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-                border: 1px solid #888;
-            }
-            QPushButton:pressed {
-                background-color: #222;
-                border: 1px solid #999;
-            }
-        """)
+        quit_button.setObjectName("CtrlBtn")
         quit_button.clicked.connect(self.confirm_quit)
         
         # Add buttons to layout
@@ -381,16 +751,16 @@ class FloatingToolbar(QWidget):
     def on_voice_dropdown_changed(self, choice):
         """Handle voice dropdown change (not applied yet)"""
         self.pending_voice = choice
-        
-        # Check if this voice has a speed default
-        if choice and self.config.has_section('SpeedDefaults'):
-            default_speed = self.config.get('SpeedDefaults', choice, fallback=None)
-            if default_speed and hasattr(self, 'speed_combo'):
-                # Find the speed in the dropdown and select it
-                speed_index = self.speed_combo.findText(default_speed)
-                if speed_index >= 0:
-                    self.speed_combo.setCurrentIndex(speed_index)
-                    self.pending_speed = default_speed
+
+        # Check if this voice has a speed default; the INI parser folds
+        # option names to lowercase, so fold the voice name to match
+        default_speed = self.cfg.speed_defaults.get(choice.lower())
+        if default_speed and self.speed_combo is not None:
+            # Find the speed in the dropdown and select it
+            speed_index = self.speed_combo.findText(default_speed)
+            if speed_index >= 0:
+                self.speed_combo.setCurrentIndex(speed_index)
+                self.pending_speed = default_speed
         
     def on_speed_dropdown_changed(self, choice):
         """Handle speed dropdown change (not applied yet)"""
@@ -398,92 +768,100 @@ class FloatingToolbar(QWidget):
         
     def apply_pending_changes(self):
         """Apply any pending voice/speed changes"""
-        from PyQt6.QtCore import QTimer
         
         commands_to_execute = []
         
         # Check if voice changed
         if self.pending_voice and self.pending_voice != self.current_voice:
-            if self.config.has_option('VoiceSpeed', 'VoiceChange'):
-                command = self.config.get('VoiceSpeed', 'VoiceChange')
-                command = command.replace('{choice}', self.pending_voice)
-                commands_to_execute.append(('voice', command))
+            if self.cfg.voice_change_tpl:
+                command = self.cfg.voice_change_tpl.replace('{choice}', self.pending_voice)
+                argv = self._choice_argv(self.cfg.voice_change_argv, self.pending_voice)
+                commands_to_execute.append(('voice', command, argv))
                 self.current_voice = self.pending_voice
+                self._settings_dirty = True
         
         # Check if speed changed  
         if self.pending_speed and self.pending_speed != self.current_speed:
-            if self.config.has_option('VoiceSpeed', 'SpeedChange'):
-                command = self.config.get('VoiceSpeed', 'SpeedChange')
-                command = command.replace('{choice}', self.pending_speed)
-                commands_to_execute.append(('speed', command))
+            if self.cfg.speed_change_tpl:
+                command = self.cfg.speed_change_tpl.replace('{choice}', self.pending_speed)
+                argv = self._choice_argv(self.cfg.speed_change_argv, self.pending_speed)
+                commands_to_execute.append(('speed', command, argv))
                 self.current_speed = self.pending_speed
+                self._settings_dirty = True
         
         # Execute commands with delay
         if commands_to_execute:
             self.execute_commands_with_delay(commands_to_execute)
             
-        # Save settings
-        if self.current_voice or self.current_speed:
-            self.save_current_settings()
+        # Save settings (no-op unless something actually changed)
+        self.save_current_settings()
     
+    @staticmethod
+    def _choice_argv(tpl_argv, choice):
+        """Substitute {choice} into a pre-split template argv"""
+        if tpl_argv is None:
+            return None
+        return tuple(arg.replace('{choice}', choice) for arg in tpl_argv)
+
     def execute_commands_with_delay(self, commands):
         """Execute a list of commands with delays between them"""
-        from PyQt6.QtCore import QTimer
         
         if not commands:
             return
-            
-        def execute_next_command(index=0):
-            if index < len(commands):
-                cmd_type, command = commands[index]
-                try:
-                    subprocess.Popen(command, shell=True)
-                    print(f"Executed {cmd_type} command: {command}")
-                except Exception as e:
-                    print(f"Error executing {cmd_type} command: {e}")
-                
-                # Schedule next command if there are more
-                if index + 1 < len(commands):
-                    delay = int(self.config.get('Behavior', 'InitializationDelay', fallback='2000'))
-                    QTimer.singleShot(delay, lambda: execute_next_command(index + 1))
-        
-        execute_next_command()
+
+        def run_one(cmd_type, command, argv):
+            try:
+                if argv:
+                    os.posix_spawnp(argv[0], argv, os.environ)
+                else:
+                    self._shell_spawn(command)
+                print(f"Executed {cmd_type} command: {command}")
+            except Exception as e:
+                print(f"Error executing {cmd_type} command: {e}")
+
+        # Schedule the whole batch up front at i*delay offsets rather
+        # than chaining singleShots from inside each callback; arguments
+        # are bound via partial so no nested closures accumulate
+        delay = self.cfg.init_delay_ms
+        for i, (cmd_type, command, argv) in enumerate(commands):
+            if i == 0:
+                run_one(cmd_type, command, argv)
+            else:
+                QTimer.singleShot(i * delay,
+                                  functools.partial(run_one, cmd_type, command, argv))
     
     def initialize_settings(self):
         """Initialize voice and speed settings on startup"""
-        from PyQt6.QtCore import QTimer
         
-        remember_settings = self.config.getboolean('Behavior', 'Remember_Voice_and_Speed', fallback=True)
+        remember_settings = self.cfg.remember_settings
         if not remember_settings:
             return
             
         commands_to_execute = []
         
         # Check if we have settings to initialize
-        if self.current_voice and self.config.has_option('VoiceSpeed', 'VoiceChange'):
-            command = self.config.get('VoiceSpeed', 'VoiceChange')
-            command = command.replace('{choice}', self.current_voice)
-            commands_to_execute.append(('voice', command))
+        if self.current_voice and self.cfg.voice_change_tpl:
+            command = self.cfg.voice_change_tpl.replace('{choice}', self.current_voice)
+            argv = self._choice_argv(self.cfg.voice_change_argv, self.current_voice)
+            commands_to_execute.append(('voice', command, argv))
             
-        if self.current_speed and self.config.has_option('VoiceSpeed', 'SpeedChange'):
-            command = self.config.get('VoiceSpeed', 'SpeedChange')
-            command = command.replace('{choice}', self.current_speed)
-            commands_to_execute.append(('speed', command))
+        if self.current_speed and self.cfg.speed_change_tpl:
+            command = self.cfg.speed_change_tpl.replace('{choice}', self.current_speed)
+            argv = self._choice_argv(self.cfg.speed_change_argv, self.current_speed)
+            commands_to_execute.append(('speed', command, argv))
         
         if commands_to_execute:
             self.initializing = True
             self.init_label.show()
-            self.adjustSize()
-            self.setFixedSize(self.size())
+            self._refit()
             
             def finish_initialization():
                 self.initializing = False
                 self.init_label.hide()
-                self.adjustSize()
-                self.setFixedSize(self.size())
+                self._refit()
             
             # Calculate total time needed
-            delay = int(self.config.get('Behavior', 'InitializationDelay', fallback='2000'))
+            delay = self.cfg.init_delay_ms
             total_time = len(commands_to_execute) * delay
             
             # Execute commands
@@ -492,8 +870,18 @@ class FloatingToolbar(QWidget):
             # Hide initialization message after all commands complete
             QTimer.singleShot(total_time, finish_initialization)
         
+    def _write_config(self):
+        """Atomically rewrite the INI from the in-memory config"""
+        tmp_path = self.config_file + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            self.config.write(f)
+        os.replace(tmp_path, self.config_file)
+
     def save_current_settings(self):
         """Save current voice and speed selections to INI file"""
+        if not self._settings_dirty:
+            return
+
         if not self.config.has_section('CurrentSettings'):
             self.config.add_section('CurrentSettings')
         
@@ -501,8 +889,8 @@ class FloatingToolbar(QWidget):
         self.config.set('CurrentSettings', 'current_speed', self.current_speed or '')
         
         try:
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+            self._write_config()
+            self._settings_dirty = False
         except Exception as e:
             print(f"Error saving current settings: {e}")
         
@@ -510,140 +898,121 @@ class FloatingToolbar(QWidget):
         """Expand the options panel"""
         if self.expanded:
             return
-            
+
         self.expanded = True
-        self.expanded_widget = self.create_expanded_widget()
-        
+
+        # Build the panel once on first use and reuse it afterwards;
+        # rebuilding widgets on every right-click is wasted work
+        if self.expanded_widget is None:
+            self.expanded_widget = self.create_expanded_widget()
+            self.main_layout.addWidget(self.expanded_widget)
+        else:
+            # Make sure the dropdowns reflect the applied settings
+            if self.voice_combo is not None and self.current_voice:
+                self.voice_combo.setCurrentText(self.current_voice)
+            if self.speed_combo is not None and self.current_speed:
+                self.speed_combo.setCurrentText(self.current_speed)
+            self.expanded_widget.show()
+
         # Set pending values to current values when opening
         self.pending_voice = self.current_voice
         self.pending_speed = self.current_speed
-        
-        self.main_layout.addWidget(self.expanded_widget)
-        
+
         # Check if animation is enabled
-        animate = self.config.getboolean('Appearance', 'animation', fallback=True)
-        
-        if animate:
-            # Set up animation
+        if self.cfg.animate and not _REDUCE_MOTION:
+            # One animation object for the panel's lifetime; expand and
+            # collapse just retarget its start/end values
+            if self.animation is None:
+                self.animation = QPropertyAnimation(self.expanded_widget, b"maximumHeight", self)
+                self.animation.setDuration(200)
+                self.animation.finished.connect(self._on_animation_finished)
             self.expanded_widget.setMaximumHeight(0)
-            self.animation = QPropertyAnimation(self.expanded_widget, b"maximumHeight")
-            self.animation.setDuration(200)
+            self.animation.stop()
+            self._anim_collapsing = False
             self.animation.setStartValue(0)
             self.animation.setEndValue(120)  # Adjust based on content
             self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
             self.animation.start()
         else:
             self.expanded_widget.setMaximumHeight(120)
-            
+
         # Adjust window size
-        self.adjustSize()
-        self.setFixedSize(self.size())
+        self._refit()
         
-    def collapse_options(self):
-        """Collapse the options panel and apply changes (OK button / right-click)"""
+    def _collapse(self, apply):
+        """Collapse the options panel, applying pending changes if asked"""
         if not self.expanded or not self.expanded_widget:
             return
-        
-        # Apply any pending changes before collapsing
-        self.apply_pending_changes()
-            
-        animate = self.config.getboolean('Appearance', 'animation', fallback=True)
-        
-        if animate:
-            self.animation = QPropertyAnimation(self.expanded_widget, b"maximumHeight")
-            self.animation.setDuration(200)
+
+        if apply:
+            # Apply any pending changes before collapsing
+            self.apply_pending_changes()
+
+        if self.cfg.animate and not _REDUCE_MOTION and self.animation is not None:
+            self.animation.stop()
+            self._anim_collapsing = True
             self.animation.setStartValue(self.expanded_widget.height())
             self.animation.setEndValue(0)
             self.animation.setEasingCurve(QEasingCurve.Type.InCubic)
-            self.animation.finished.connect(self.remove_expanded_widget)
             self.animation.start()
         else:
             self.remove_expanded_widget()
-            
+
+    def collapse_options(self):
+        """Collapse the options panel and apply changes (OK button / right-click)"""
+        self._collapse(apply=True)
+
     def cancel_changes(self):
         """Cancel changes and collapse without applying (Cancel button)"""
         if not self.expanded or not self.expanded_widget:
             return
-            
+
         # Reset pending values to current values (discard changes)
         self.pending_voice = self.current_voice
         self.pending_speed = self.current_speed
-        
-        # Update dropdowns to show current values (revert any changes)
-        if hasattr(self, 'voice_combo') and self.current_voice:
-            self.voice_combo.setCurrentText(self.current_voice)
-        if hasattr(self, 'speed_combo') and self.current_speed:
-            self.speed_combo.setCurrentText(self.current_speed)
-        
-        # Collapse without applying changes
-        animate = self.config.getboolean('Appearance', 'animation', fallback=True)
-        
-        if animate:
-            self.animation = QPropertyAnimation(self.expanded_widget, b"maximumHeight")
-            self.animation.setDuration(200)
-            self.animation.setStartValue(self.expanded_widget.height())
-            self.animation.setEndValue(0)
-            self.animation.setEasingCurve(QEasingCurve.Type.InCubic)
-            self.animation.finished.connect(self.remove_expanded_widget)
-            self.animation.start()
-        else:
+
+        # Revert the dropdowns without re-firing currentTextChanged
+        # (which would chase SpeedDefaults and rewrite pending_* again)
+        if self.voice_combo is not None and self.current_voice:
+            with QSignalBlocker(self.voice_combo):
+                self.voice_combo.setCurrentText(self.current_voice)
+        if self.speed_combo is not None and self.current_speed:
+            with QSignalBlocker(self.speed_combo):
+                self.speed_combo.setCurrentText(self.current_speed)
+
+        self._collapse(apply=False)
+
+    def _on_animation_finished(self):
+        """Finish the running expand or collapse"""
+        if self._anim_collapsing:
             self.remove_expanded_widget()
-            
-    def cancel_changes(self):
-        """Cancel changes and collapse without applying"""
-        # Reset pending values to current values
-        self.pending_voice = self.current_voice
-        self.pending_speed = self.current_speed
-        
-        # Update dropdowns to show current values (not pending changes)
-        if hasattr(self, 'voice_combo') and self.current_voice:
-            self.voice_combo.setCurrentText(self.current_voice)
-        if hasattr(self, 'speed_combo') and self.current_speed:
-            self.speed_combo.setCurrentText(self.current_speed)
-        
-        # Collapse without applying changes
-        self.collapse_options_without_applying()
-        
-    def collapse_options_without_applying(self):
-        """Collapse the options panel without applying changes"""
-        if not self.expanded or not self.expanded_widget:
-            return
-            
-        animate = self.config.getboolean('Appearance', 'animation', fallback=True)
-        
-        if animate:
-            self.animation = QPropertyAnimation(self.expanded_widget, b"maximumHeight")
-            self.animation.setDuration(200)
-            self.animation.setStartValue(self.expanded_widget.height())
-            self.animation.setEndValue(0)
-            self.animation.setEasingCurve(QEasingCurve.Type.InCubic)
-            self.animation.finished.connect(self.remove_expanded_widget)
-            self.animation.start()
         else:
-            self.remove_expanded_widget()
-            
+            self._refit()
+
     def remove_expanded_widget(self):
-        """Remove the expanded widget after animation"""
+        """Hide the expanded widget after the collapse animation"""
         if self.expanded_widget:
-            self.main_layout.removeWidget(self.expanded_widget)
-            self.expanded_widget.deleteLater()
-            self.expanded_widget = None
-            
+            self.expanded_widget.hide()
+
         self.expanded = False
-        self.adjustSize()
-        self.setFixedSize(self.size())
+        self._refit()
         
     def confirm_quit(self):
         """Show quit confirmation dialog or quit directly"""
-        confirm_quit = self.config.getboolean('Behavior', 'ConfirmQuit', fallback=True)
+        confirm_quit = self.cfg.confirm_quit
         
         if confirm_quit:
-            reply = QMessageBox.question(self, 'Quit Toolbar', 
-                                       'Quit the toolbar?',
-                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                       QMessageBox.StandardButton.No)
-            
-            if reply == QMessageBox.StandardButton.Yes:
+            # Build the dialog once and re-exec it; QMessageBox.question
+            # constructs a fresh modal dialog on every call
+            if self._quit_box is None:
+                self._quit_box = QMessageBox(
+                    QMessageBox.Icon.Question, 'Quit Toolbar',
+                    'Quit the toolbar?',
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    self)
+                self._quit_box.setDefaultButton(QMessageBox.StandardButton.No)
+
+            if self._quit_box.exec() == QMessageBox.StandardButton.Yes:
                 self.quit_application()
         else:
             self.quit_application()
@@ -651,169 +1020,191 @@ class FloatingToolbar(QWidget):
     def quit_application(self):
         """Handle the actual quit process"""
         # Check if we should clear settings on quit
-        remember_settings = self.config.getboolean('Behavior', 'Remember_Voice_and_Speed', fallback=True)
+        remember_settings = self.cfg.remember_settings
         if not remember_settings:
             self.clear_current_settings()
+        self._save_position()
+        self._close_shell()
         QApplication.quit()
+
+    def closeEvent(self, event):
+        """Persist the dragged position when the window is closed"""
+        self._save_position()
+        self._close_shell()
+        event.accept()
     
     def clear_current_settings(self):
         """Clear current voice and speed settings from INI file"""
         if self.config.has_section('CurrentSettings'):
             self.config.remove_section('CurrentSettings')
             try:
-                with open(self.config_file, 'w') as f:
-                    self.config.write(f)
+                self._write_config()
             except Exception as e:
                 print(f"Error clearing current settings: {e}")
         
-    def execute_command(self, command_key):
+    def _spawn(self, key, command):
+        """Launch a button command, skipping the shell when possible"""
+        argv = self.cfg.argv.get(key)
+        if argv:
+            try:
+                # spawnp searches PATH itself, covering commands that
+                # which() could not resolve at config-load time
+                os.posix_spawnp(argv[0], argv, os.environ)
+                return
+            except OSError:
+                pass  # executable vanished since load - let the shell try
+        self._shell_spawn(command)
+
+    @staticmethod
+    def _reap_children(signum, frame):
+        """Collect any exited child processes (SIGCHLD handler)"""
+        try:
+            while os.waitpid(-1, os.WNOHANG) != (0, 0):
+                pass
+        except ChildProcessError:
+            pass  # No children left
+
+    def _ensure_shell(self):
+        """Start the /bin/sh coprocess if it isn't already running"""
+        if self._sh is None or self._sh.poll() is not None:
+            # close_fds=False skips the close-everything loop in the
+            # child (we hold no FDs that need protecting) and
+            # start_new_session keeps launched media tools alive if
+            # the toolbar exits or catches Ctrl-C
+            self._sh = subprocess.Popen(['/bin/sh'],
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL,
+                                        close_fds=False,
+                                        start_new_session=True)
+
+    def _shell_spawn(self, command):
+        """Run a shell command through a long-lived /bin/sh coprocess.
+
+        Spawning /bin/sh -c per command pays a fork+exec of the shell each
+        time; feeding one persistent sh instead leaves only the command's
+        own exec. The trailing '&' backgrounds the child so the coprocess
+        is immediately ready for the next command.
+        """
+        try:
+            self._ensure_shell()
+            self._sh.stdin.write((command + ' &\n').encode())
+            self._sh.stdin.flush()
+        except (OSError, ValueError):
+            # Coprocess died mid-write; run this one directly
+            self._sh = None
+            subprocess.Popen(command, shell=True,
+                             close_fds=False, start_new_session=True)
+
+    def _close_shell(self):
+        """Shut down the shell coprocess, if one was started"""
+        if self._sh is not None:
+            try:
+                self._sh.stdin.close()
+            except OSError:
+                pass
+            self._sh = None
+
+    def execute_command(self, command_key, _checked=False):
         """Execute the command associated with the button"""
         try:
-            # Handle play/pause state logic
-            if command_key == 'play':
-                if self.play_state == "paused":
-                    # If paused, resume instead of play
-                    command = self.config.get('Commands', 'resume', fallback='')
-                    if command:
-                        subprocess.Popen(command, shell=True)
-                        self.play_state = "playing"
-                        print(f"Resumed playback, state: {self.play_state}")
-                else:
-                    # Not playing or unknown - start/restart playback
-                    command = self.config.get('Commands', 'play', fallback='')
-                    if command:
-                        subprocess.Popen(command, shell=True)
-                        self.play_state = "playing"
-                        print(f"Started/restarted playback, state: {self.play_state}")
+            # One table lookup replaces the old play/pause/stop ladder
+            entry = (_DISPATCH.get((command_key, self.play_state)) or
+                     _DISPATCH.get((command_key, None)))
+            if entry is None:
+                print(f"No command configured for {command_key}")
                 return
-                    
-            elif command_key == 'pause':
-                if self.play_state == "playing":
-                    # Playing, so pause
-                    command = self.config.get('Commands', 'pause', fallback='')
-                    if command:
-                        subprocess.Popen(command, shell=True)
-                        self.play_state = "paused"
-                        print(f"Paused playback, state: {self.play_state}")
-                elif self.play_state == "paused":
-                    # Already paused, resume
-                    command = self.config.get('Commands', 'resume', fallback='')
-                    if command:
-                        subprocess.Popen(command, shell=True)
-                        self.play_state = "playing"
-                        print(f"Resumed from pause button, state: {self.play_state}")
-                else:
-                    # Not playing/paused - treat as pause command anyway
-                    command = self.config.get('Commands', 'pause', fallback='')
-                    if command:
-                        subprocess.Popen(command, shell=True)
-                        print(f"Executed pause command, keeping state: {self.play_state}")
-                return
-                    
-            elif command_key == 'stop':
-                # Stop playback and reset state
-                command = self.config.get('Commands', 'stop', fallback='')
-                if command:
-                    subprocess.Popen(command, shell=True)
-                    self.play_state = ""
-                    print(f"Stopped playback, state: {self.play_state}")
-                return
-                
-            elif command_key in ['rewind', 'fast_forward']:
-                # Seeking - execute command and set state to playing
-                command = self.config.get('Commands', command_key, fallback='')
-                if command:
-                    subprocess.Popen(command, shell=True)
-                    self.play_state = "playing"
-                    print(f"Seeking ({command_key}), state: {self.play_state}")
-                return
-                
-            else:
-                # Other commands (like record) don't affect play state
-                command = self.config.get('Commands', command_key, fallback='')
-                if command:
-                    subprocess.Popen(command, shell=True)
-                    print(f"Executed {command_key} command")
-                else:
-                    print(f"No command configured for {command_key}")
-                    
+
+            run_key, new_state, message = entry
+            command = self.cfg.commands.get(run_key, '')
+            if command:
+                self._spawn(run_key, command)
+                if new_state is not None:
+                    self.play_state = new_state
+                print(f"{message}, state: {self.play_state}")
+            elif run_key == command_key:
+                print(f"No command configured for {command_key}")
+
         except Exception as e:
             print(f"Error executing command for {command_key}: {e}")
             
-    def setup_dragging(self, widget):
-        """Enable dragging for a widget"""
-        original_press = widget.mousePressEvent
-        original_move = widget.mouseMoveEvent
-        original_release = widget.mouseReleaseEvent
-        
-        def mouse_press(event):
+    def _drag_press(self, event):
+        """Record the press point and window offset for a potential drag"""
+        self.draggable = True
+        self.drag_started = False  # Track if we actually started dragging
+        # One QPointF conversion per press; the offset is the global
+        # press point relative to the window origin
+        press_point = event.globalPosition().toPoint()
+        pos = self.pos()
+        self._off_x = press_point.x() - pos.x()
+        self._off_y = press_point.y() - pos.y()
+        self._press_x = press_point.x()
+        self._press_y = press_point.y()
+
+    def _drag_move(self, event):
+        """Shared move logic; returns True while actively dragging"""
+        current_pos = event.globalPosition().toPoint()
+        if self.drag_started:
+            self._queue_move(current_pos.x() - self._off_x, current_pos.y() - self._off_y)
+            return True
+        # Only start dragging if mouse left a small radius around the
+        # press point. Jitter inside the threshold box is rejected with
+        # a single OR/compare; only near-crossings pay for the
+        # squared-distance test. (This widens the hysteresis region
+        # slightly toward the bounding square, which is imperceptible at
+        # a 5 px threshold.)
+        dx = current_pos.x() - self._press_x
+        dy = current_pos.y() - self._press_y
+        if (abs(dx) | abs(dy)) <= 5:
+            return False
+        if dx * dx + dy * dy > 25:  # 5 pixel threshold
+            self.drag_started = True
+            self._queue_move(current_pos.x() - self._off_x, current_pos.y() - self._off_y)
+            return True
+        return False
+
+    def _drag_release(self):
+        """End a drag; returns True if a drag actually happened"""
+        was_dragging = self.drag_started
+        self.draggable = False
+        self.drag_started = False
+        return was_dragging
+
+    def eventFilter(self, obj, event):
+        """Drag handling for the toolbar buttons, installed once per button"""
+        etype = event.type()
+        if etype == QEvent.Type.MouseMove:
+            return self.draggable and self._drag_move(event)
+
+        elif etype == QEvent.Type.MouseButtonPress:
             if event.button() == Qt.MouseButton.LeftButton:
-                self.draggable = True
-                self.drag_started = False  # Track if we actually started dragging
-                self.offset = event.globalPosition().toPoint() - self.pos()
-                self.press_pos = event.globalPosition().toPoint()
-            # Always call original handler
-            original_press(event)
-            
-        def mouse_move(event):
-            if self.draggable and self.offset is not None:
-                # Only start dragging if mouse moved more than a few pixels
-                current_pos = event.globalPosition().toPoint()
-                if not self.drag_started:
-                    distance = (current_pos - self.press_pos).manhattanLength()
-                    if distance > 5:  # 5 pixel threshold
-                        self.drag_started = True
-                
-                if self.drag_started:
-                    self.move(current_pos - self.offset)
-                    return  # Don't call original move handler when dragging
-            
-            original_move(event)
-            
-        def mouse_release(event):
+                self._drag_press(event)
+            # Let the button see the press so it can show its pressed state
+            return False
+
+        elif etype == QEvent.Type.MouseButtonRelease:
             if event.button() == Qt.MouseButton.LeftButton:
-                was_dragging = self.drag_started
-                self.draggable = False
-                self.drag_started = False
-                self.offset = None
-                
-                # Only call original handler if we weren't dragging
-                if not was_dragging:
-                    original_release(event)
-            else:
-                original_release(event)
-        
-        widget.mousePressEvent = mouse_press
-        widget.mouseMoveEvent = mouse_move  
-        widget.mouseReleaseEvent = mouse_release
-            
+                # Swallow the release after a drag so it doesn't click
+                return self._drag_release()
+            return False
+
+        return super().eventFilter(obj, event)
+
     def mousePressEvent(self, event):
         """Handle mouse press for dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.draggable = True
-            self.drag_started = False
-            self.offset = event.position().toPoint()
-            self.press_pos = event.globalPosition().toPoint()
-            
+            self._drag_press(event)
+
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging"""
-        if self.draggable and self.offset is not None:
-            current_pos = event.globalPosition().toPoint()
-            if not self.drag_started:
-                distance = (current_pos - self.press_pos).manhattanLength()
-                if distance > 5:
-                    self.drag_started = True
-            
-            if self.drag_started:
-                self.move(current_pos - self.offset)
-            
+        if self.draggable:
+            self._drag_move(event)
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.draggable = False
-            self.drag_started = False
-            self.offset = None
-            
+            self._drag_release()
+
     def contextMenuEvent(self, event):
         """Handle right-click to show expanded options"""
         if self.expanded:
@@ -822,6 +1213,15 @@ class FloatingToolbar(QWidget):
             self.expand_options()
 
 def main():
+    # Let Qt coalesce bursts of mouse-move events before they reach
+    # Python, so drag handling runs at frame rate rather than raw
+    # pointer rate; skip synthesizing mouse events from touch since the
+    # toolbar has no touch-specific handling
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressTabletEvents, True)
+    QApplication.setAttribute(
+        Qt.ApplicationAttribute.AA_SynthesizeMouseForUnhandledTouchEvents, False)
+
     app = QApplication(sys.argv)
     
     # Set application properties
@@ -831,8 +1231,13 @@ def main():
     toolbar = FloatingToolbar()
     toolbar.show()
     
-    # Start event loop
-    sys.exit(app.exec())
+    # Start event loop. Config writes and shell shutdown happen in
+    # quit_application/closeEvent before exec() returns, so skip the
+    # interpreter's own teardown (widget destructors, atexit chains) and
+    # return the terminal immediately; children are session-detached.
+    rc = app.exec()
+    sys.stdout.flush()
+    os._exit(rc)
 
 if __name__ == '__main__':
     main()